@@ -1,33 +1,88 @@
 import re
+import string
+import functools
+from collections import namedtuple
 import tkinter as tk
 from tkinter import ttk
 import math
+import sys
 import time
 
 # --- CONSTANTS FOR ADVANCED ANALYSIS ---
 
 # 1. Simple Dictionary/Breach Approximation (V1 & V6)
-COMMON_WEAK_WORDS = [
+COMMON_WEAK_WORDS = (
     "password", "123456", "qwerty", "admin", "qazwsx", "football", "summer", 
     "spring", "welcome", "secure", "secret", "test", "shadow", "master", 
     "default", "change", "dropbox", "america", "india", "ganesh", "shahan"
-]
+)
 
 # 2. V8: AI Pattern Heuristic Segments (Simulated)
 # These are common components users combine to create predictable passwords (e.g., ShadowMaster, DragonFire123)
-COMPLEX_WEAK_COMBINATIONS = [
+COMPLEX_WEAK_COMBINATIONS = (
     "master", "shadow", "dragon", "ninja", "firewall", "dark", "light", 
     "ocean", "fire", "secure", "strong", "magic", "power", "happy", "love"
-]
+)
 
 
 # 3. Keyboard Patterns (V2)
-KEYBOARD_PATTERNS = [
+KEYBOARD_PATTERNS = (
     r"asdfg", r"zxcvb", r"qwert", r"yuiop", # Rows
     r"12345", r"54321", r"abcde", r"edcba", # Simple sequences
     r"qaz", r"wsx", r"edc", r"rfv", # Diagonal/vertical patterns
     r"789", r"987", r"456", r"654", r"258", r"147" # Numpad/keyboard blocks
-]
+)
+
+# List position of each word, so the first listed match among the scan hits is a dict lookup
+WEAK_WORD_RANK = {word: rank for rank, word in enumerate(COMMON_WEAK_WORDS)}
+COMBINATION_RANK = {word: rank for rank, word in enumerate(COMPLEX_WEAK_COMBINATIONS)}
+
+# Character classes for the single-pass classifier
+LOWER = frozenset(string.ascii_lowercase)
+UPPER = frozenset(string.ascii_uppercase)
+DIGITS = frozenset(string.digits)
+ALNUM = LOWER | UPPER | DIGITS
+
+# Size each character class adds to the pool (R); bit i of a class mask marks entry i
+CHARACTER_CLASS_POOLS = (('lower', 26), ('upper', 26), ('digit', 10), ('symbol', 33))
+
+def pool_for_mask(mask):
+    """Calculates the size of the character set (R) for a class mask; must be at least 1."""
+    pool_size = sum(size for bit, (_, size) in enumerate(CHARACTER_CLASS_POOLS) if mask >> bit & 1)
+    return max(1, pool_size)
+
+# log2(R) for all 16 class combinations, so entropy needs no log call per keystroke
+POOL_LOG2 = {mask: math.log2(pool_for_mask(mask)) for mask in range(16)}
+
+# Precompiled regex patterns (compiled once at import, reused on every keystroke)
+REPEAT_RX = re.compile(r"(.)\1{2,}")
+YEAR_PATTERN = r"(?:19|20)\d{2}"
+SEQUENCE_RX = re.compile(r"(123|abc|xyz|qwerty)") # Matched against the lowercased password
+
+# Shortest text any deduction looks for ('aaa', '123', 'qaz'); shorter passwords skip the checks
+MIN_PATTERN_LENGTH = min(3, min(map(len, COMMON_WEAK_WORDS + KEYBOARD_PATTERNS)))
+
+# V8: Word + Digit + Word and Word + Digits at the end, one alternation over every segment.
+# The lookahead makes finditer report the segment matching at each position (even overlapping ones).
+COMBINATION_ALTERNATION = "|".join(map(re.escape, COMPLEX_WEAK_COMBINATIONS))
+WORD_DIGIT_WORD_RX = re.compile(rf"(?=({COMBINATION_ALTERNATION})\d+[a-z]+)")
+WORD_DIGITS_END_RX = re.compile(rf"(?=({COMBINATION_ALTERNATION})\d{{3,4}}$)")
+# Shortest text either regex can match: the shortest segment, one digit and one letter
+MIN_AI_DIGITS_LENGTH = min(map(len, COMPLEX_WEAK_COMBINATIONS)) + 2
+
+# V8: Every Word-Word concatenation (e.g., 'shadowmaster'), built once as (first word, concatenation) pairs
+CONCAT_WEAK = tuple(
+    (word1, word1 + word2)
+    for word1 in COMPLEX_WEAK_COMBINATIONS
+    for word2 in COMPLEX_WEAK_COMBINATIONS
+    if word1 != word2
+)
+
+# V7: Any common weak word before or after a year, all words and both orders in one regex
+WEAK_WORD_ALTERNATION = "|".join(map(re.escape, COMMON_WEAK_WORDS))
+YEAR_NEAR_WORD_RX = re.compile(
+    rf"(?:{WEAK_WORD_ALTERNATION}).*{YEAR_PATTERN}|{YEAR_PATTERN}.*(?:{WEAK_WORD_ALTERNATION})"
+)
 
 # 4. Time-to-Crack Estimation (V5)
 # This uses the assumed cracking speed of 10 billion hashes/second (10^10)
@@ -42,24 +97,114 @@ SECONDS_IN = {
     'year': 31536000,
     'century': 3153600000
 }
+# Same speed and units in log2 space, so crack-time buckets are picked without computing 2^E
+LOG2_CRACK_SPEED = math.log2(CRACK_SPEED_PER_SECOND)
+LOG2_SECONDS_IN = {unit: math.log2(seconds) for unit, seconds in SECONDS_IN.items()}
+
+# --- SINGLE-PASS PATTERN MATCHING (Aho-Corasick) ---
+
+def build_automaton(keywords):
+    """
+    Builds an Aho-Corasick automaton over a {keyword: [(category, value), ...]} mapping.
+    Returns (goto, fail, output) tables where state 0 is the root.
+    """
+    goto = [{}]
+    output = [[]]
+    for keyword, payloads in keywords.items():
+        state = 0
+        for char in keyword:
+            if char not in goto[state]:
+                goto.append({})
+                output.append([])
+                goto[state][char] = len(goto) - 1
+            state = goto[state][char]
+        output[state].extend(payloads)
+
+    # Breadth-first pass to wire up failure links and inherit their outputs
+    fail = [0] * len(goto)
+    queue = list(goto[0].values())
+    for state in queue:
+        for char, child in goto[state].items():
+            queue.append(child)
+            fallback = fail[state]
+            while fallback and char not in goto[fallback]:
+                fallback = fail[fallback]
+            fail[child] = goto[fallback].get(char, 0)
+            output[child] = output[child] + output[fail[child]]
+    return goto, fail, output
+
+def scan_automaton(automaton, text):
+    """Yields every (category, value) payload whose keyword occurs in text, in one pass."""
+    goto, fail, output = automaton
+    state = 0
+    for char in text:
+        while state and char not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(char, 0)
+        yield from output[state]
+
+def _pattern_keywords():
+    """Collects every fixed-string pattern (V1/V6, V2, V8) with the category it belongs to."""
+    keywords = {}
+    for word in COMMON_WEAK_WORDS:
+        keywords.setdefault(word, []).append(('weak_word', word))
+    for pattern in KEYBOARD_PATTERNS:
+        keywords.setdefault(pattern, []).append(('keyboard', pattern))
+    for word1, concat in CONCAT_WEAK:
+        keywords.setdefault(concat, []).append(('ai_concat', word1))
+    return keywords
+
+# Built once at import; a single scan replaces the per-word substring loops
+PATTERN_AUTOMATON = build_automaton(_pattern_keywords())
+
+def find_pattern_hits(password_lower):
+    """Scans the lowercased password once and groups the matched patterns by category."""
+    hits = {'weak_word': set(), 'keyboard': set(), 'ai_concat': set(), 'ai_digits': set()}
+    for category, value in scan_automaton(PATTERN_AUTOMATON, password_lower):
+        hits[category].add(value)
+    # V8 segments followed by digits (e.g., 'Shadow123Master', 'Dragon1990'), if long enough to hold one
+    if len(password_lower) < MIN_AI_DIGITS_LENGTH:
+        return hits
+    for rx in (WORD_DIGIT_WORD_RX, WORD_DIGITS_END_RX):
+        hits['ai_digits'].update(match.group(1) for match in rx.finditer(password_lower))
+    return hits
+
+def has_block_repeat(password, k):
+    """
+    V3: True if some k-character block is immediately repeated (e.g., 'abab' for k=2).
+    That holds exactly when k consecutive characters each equal the one k positions later,
+    so a single pass counting the current run of such matches is enough.
+    """
+    run = 0
+    for char, later in zip(password, password[k:]):
+        run = run + 1 if char == later else 0
+        if run == k:
+            return True
+    return False
+
 
 # --- STRENGTH LOGIC BASED ON ENTROPY ---
 
-def get_character_pool_size(password):
-    """Calculates the size of the character set (R) used in the password."""
-    pool_size = 0
-    if re.search(r"[a-z]", password):
-        pool_size += 26
-    if re.search(r"[A-Z]", password):
-        pool_size += 26
-    if re.search(r"\d", password):
-        pool_size += 10
-    # Custom symbols (covers common punctuation and special chars)
-    if re.search(r"[^a-zA-Z0-9\s]", password):
-        pool_size += 33 
-    return max(1, pool_size) # Must be at least 1
-
-def calculate_entropy_bits(password):
+def get_character_classes(password):
+    """Detects which character classes the password uses in a single pass."""
+    chars = set(password)
+    return {
+        'lower': not chars.isdisjoint(LOWER),
+        'upper': not chars.isdisjoint(UPPER),
+        'digit': not chars.isdisjoint(DIGITS),
+        # Custom symbols (covers common punctuation and special chars)
+        'symbol': any(c not in ALNUM and not c.isspace() for c in chars)
+    }
+
+def get_class_mask(char_classes):
+    """Packs the detected character classes into a 4-bit mask (one bit per CHARACTER_CLASS_POOLS entry)."""
+    mask = 0
+    for bit, (name, _) in enumerate(CHARACTER_CLASS_POOLS):
+        if char_classes[name]:
+            mask |= 1 << bit
+    return mask
+
+def calculate_entropy_bits(password, char_classes=None):
     """
     V4: Calculates cryptographic entropy (bits of randomness).
     Entropy = Length * log2(Pool Size)
@@ -68,9 +213,9 @@ def calculate_entropy_bits(password):
     if length == 0:
         return 0
     
-    pool_size = get_character_pool_size(password)
-    entropy = length * math.log2(pool_size)
-    return entropy
+    if char_classes is None:
+        char_classes = get_character_classes(password)
+    return length * POOL_LOG2[get_class_mask(char_classes)]
 
 def estimate_crack_time(entropy_bits):
     """
@@ -79,159 +224,185 @@ def estimate_crack_time(entropy_bits):
     if entropy_bits <= 0:
         return "Instantly"
     
-    # Total possible combinations (2^E)
-    total_combinations = math.pow(2, entropy_bits)
-    
-    # Estimated seconds to crack
-    seconds = total_combinations / CRACK_SPEED_PER_SECOND
+    # Work in log2 space: seconds = 2^E / speed, so log2(seconds) = E - log2(speed).
+    # 2^E is never materialized (it overflows a float for very long passwords).
+    log2_seconds = entropy_bits - LOG2_CRACK_SPEED
     
-    # Categorize time for human readability
-    if seconds < SECONDS_IN['millisecond']:
+    # Categorize time for human readability, exponentiating only the chosen unit
+    if log2_seconds < LOG2_SECONDS_IN['millisecond']:
         return "Instantly (< 1 ms)"
-    elif seconds < 1:
-        ms = seconds * 1000
+    elif log2_seconds < LOG2_SECONDS_IN['second']:
+        ms = 2.0 ** (log2_seconds - LOG2_SECONDS_IN['millisecond'])
         return f"{ms:.2f} milliseconds"
-    elif seconds < SECONDS_IN['minute']:
+    elif log2_seconds < LOG2_SECONDS_IN['minute']:
+        seconds = 2.0 ** log2_seconds
         return f"{seconds:.2f} seconds"
-    elif seconds < SECONDS_IN['hour']:
-        minutes = seconds / SECONDS_IN['minute']
+    elif log2_seconds < LOG2_SECONDS_IN['hour']:
+        minutes = 2.0 ** (log2_seconds - LOG2_SECONDS_IN['minute'])
         return f"{minutes:.2f} minutes"
-    elif seconds < SECONDS_IN['day']:
-        hours = seconds / SECONDS_IN['hour']
+    elif log2_seconds < LOG2_SECONDS_IN['day']:
+        hours = 2.0 ** (log2_seconds - LOG2_SECONDS_IN['hour'])
         return f"{hours:.2f} hours"
-    elif seconds < SECONDS_IN['year']:
-        days = seconds / SECONDS_IN['day']
+    elif log2_seconds < LOG2_SECONDS_IN['year']:
+        days = 2.0 ** (log2_seconds - LOG2_SECONDS_IN['day'])
         return f"{days:.2f} days"
-    elif seconds < SECONDS_IN['century']:
-        years = seconds / SECONDS_IN['year']
+    elif log2_seconds < LOG2_SECONDS_IN['century']:
+        years = 2.0 ** (log2_seconds - LOG2_SECONDS_IN['year'])
         return f"{years:.2f} years"
     else:
-        centuries = seconds / SECONDS_IN['century']
-        return f"{centuries:.2f} centuries"
+        log2_centuries = log2_seconds - LOG2_SECONDS_IN['century']
+        if log2_centuries < sys.float_info.max_exp:
+            centuries = 2.0 ** log2_centuries
+            return f"{centuries:.2f} centuries"
+        # Too large for a float: show it as mantissa and power of ten instead
+        exponent, fraction = divmod(log2_centuries * math.log10(2), 1)
+        return f"{10 ** fraction:.2f}e+{int(exponent)} centuries"
 
 
-def calculate_modified_score(password, entropy_bits):
+def calculate_modified_score(password, entropy_bits, char_classes=None, password_lower=None):
     """
     Combines Entropy with deductions for known weaknesses (V1, V2, V3, V7, V8).
     The deductions reduce the final effective score (entropy) to reflect real-world weakness.
+    Returns (score, flags) where flags records which weaknesses were found, for feedback.
     """
     score = entropy_bits # Start the score as the maximum theoretical entropy
     
-    password_lower = password.lower()
+    flags = {
+        'weak_word': None,          # First matching COMMON_WEAK_WORDS entry
+        'ai_weak': None,            # 'concat' or 'digits' (V8)
+        'keyboard': False,
+        'repeat_block': False,
+        'triple_repeat': False,
+        'sequence': False,
+        'year_symbol_word': False
+    }
+
+    # Fast path: every check needs at least MIN_PATTERN_LENGTH characters, so the
+    # first keystrokes skip the scans entirely
+    length = len(password)
+    if length < MIN_PATTERN_LENGTH:
+        return max(0, round(score)), flags
+
+    if password_lower is None:
+        password_lower = password.lower()
+    hits = find_pattern_hits(password_lower)
 
     # --- Deductions ---
 
     # V1 & V6: Dictionary/Breach Check (Heavy Penalty)
-    for word in COMMON_WEAK_WORDS:
-        if word in password_lower:
-            # Huge penalty for containing a common word or breach password
-            score -= 20 
-            break
+    if hits['weak_word']:
+        # Huge penalty for containing a common word or breach password
+        score -= 20 
+        flags['weak_word'] = min(hits['weak_word'], key=WEAK_WORD_RANK.__getitem__)
 
     # V2: Keyboard Pattern Detection (Medium Penalty)
-    for pattern in KEYBOARD_PATTERNS:
-        if pattern in password_lower:
-            score -= 10
-            break
+    if hits['keyboard']:
+        score -= 10
+        flags['keyboard'] = True
 
     # V8: AI Pattern Heuristic (Simulated Contextual Detection) (Severe Penalty)
     # Checks for composite weak phrases (e.g., 'MasterFirewall') and common word/digit combos
-    is_ai_weak = False
-    for word1 in COMPLEX_WEAK_COMBINATIONS:
+    ai_hits = hits['ai_concat'] | hits['ai_digits']
+    if ai_hits:
+        # The earliest listed segment decides, as if walking COMPLEX_WEAK_COMBINATIONS in order
+        word1 = min(ai_hits, key=COMBINATION_RANK.__getitem__)
         # Check for Word-Word concatenation
-        for word2 in COMPLEX_WEAK_COMBINATIONS:
-            if word1 != word2 and f"{word1}{word2}" in password_lower:
-                score -= 30 
-                is_ai_weak = True
-                break
-        if is_ai_weak: break
-        
-        # Check for Word + Digit + Word (e.g., 'Shadow123Master')
-        if re.search(f"{word1}\d+[a-z]+", password_lower):
-             score -= 20
-             is_ai_weak = True
-             break
-        
-        # Check for Word + Digits at the end (e.g., 'Dragon1990')
-        if re.search(f"{word1}\d{{3,4}}$", password_lower):
+        if word1 in hits['ai_concat']:
+            score -= 30 
+            flags['ai_weak'] = 'concat'
+        # Otherwise Word + Digit + Word (e.g., 'Shadow123Master') or Word + Digits at the end (e.g., 'Dragon1990')
+        else:
              score -= 20
-             is_ai_weak = True
-             break
+             flags['ai_weak'] = 'digits'
 
 
     # V3: Substring Repetition Logic (e.g., 'abcabc')
     # Check for repeating patterns of length 2 or 3
-    length = len(password)
     if length >= 4:
         # Check for 2-character repeat (e.g., 'abab')
-        if re.search(r"(.{2})\1+", password):
+        if has_block_repeat(password, 2):
             score -= 15
+            flags['repeat_block'] = True
         # Check for 3-character repeat (e.g., 'abcabc')
-        if re.search(r"(.{3})\1+", password):
+        if has_block_repeat(password, 3):
             score -= 15
+            flags['repeat_block'] = True
 
     # Original Deduction for Repeated Characters (e.g., 'aaaaa')
-    repeat_match = re.findall(r"(.)\1{2,}", password)
-    if repeat_match:
-        score -= len(repeat_match) * 10 
+    repeat_runs = sum(1 for _ in REPEAT_RX.finditer(password))
+    if repeat_runs:
+        score -= repeat_runs * 10 
+        flags['triple_repeat'] = True
     
     # V7: Predictable Component Detection (Name + Year + Symbol Approximation)
     # Check if a 4-digit number (year) is combined with a common word/name
-    year_pattern = r"(19|20)\d{2}"
-    
-    contains_year = re.search(year_pattern, password) is not None
-    contains_symbol = re.search(r"[^a-zA-Z0-9\s]", password) is not None
+    if char_classes is None:
+        char_classes = get_character_classes(password)
+    contains_symbol = char_classes['symbol']
+    contains_digit = char_classes['digit']
     
-    if contains_year and contains_symbol:
-        for word in COMMON_WEAK_WORDS:
-            # Check if a known word is near the year/symbol combo
-            if re.search(f"{word}.*{year_pattern}", password_lower) or re.search(f"{year_pattern}.*{word}", password_lower):
-                 score -= 25 # Severe penalty for predictable components
-                 break
+    # Only worth searching when the automaton scan found a weak word; a match implies the year
+    if contains_symbol and contains_digit and hits['weak_word'] and YEAR_NEAR_WORD_RX.search(password_lower):
+        score -= 25 # Severe penalty for predictable components
+        flags['year_symbol_word'] = True
 
     # Original Deduction for Simple Sequences (e.g., '123' or 'abc')
-    if re.search(r"(123|abc|xyz|qwerty)", password, re.IGNORECASE):
+    if SEQUENCE_RX.search(password_lower):
            score -= 10
+           flags['sequence'] = True
     
-    return max(0, round(score))
+    return max(0, round(score)), flags
+
+
+# Immutable result of get_strength_details (safe to share from the LRU cache)
+StrengthDetails = namedtuple('StrengthDetails', ['score', 'strength', 'color', 'percent', 'time_to_crack', 'feedback'])
+
+# Strength levels as (minimum effective entropy, label, color), strongest first
+NO_PASSWORD_COLOR = "#D1D5DB"
+STRENGTH_BUCKETS = (
+    (65, "Excellent (Uncrackable)", "#10B981"),  # Emerald Green
+    (51, "Strong", "#059669"),                   # Dark Green
+    (35, "Moderate", "#F59E0B"),                 # Yellow/Amber
+    (15, "Weak", "#EF4444"),                     # Red
+    (0, "Too Weak", "#B91C1C"),                  # Dark Red
+)
 
+# Every color get_strength_details can return
+STRENGTH_COLORS = (NO_PASSWORD_COLOR,) + tuple(color for _, _, color in STRENGTH_BUCKETS)
 
+def pick_bucket(buckets, value):
+    """Returns the rest of the first (threshold, ...) bucket whose threshold value reaches."""
+    return next(rest for threshold, *rest in buckets if value >= threshold)
+
+# Bounded so plaintext passwords don't pile up in memory; cleared when the field is emptied
+STRENGTH_CACHE_SIZE = 512
+
+@functools.lru_cache(maxsize=STRENGTH_CACHE_SIZE)
 def get_strength_details(password):
     """Maps score to level, color, feedback, and calculates Time-to-Crack."""
     length = len(password)
     
     if length == 0:
-        return {"score": 0, "strength": "No Password", "color": "#D1D5DB", "percent": 0, "time_to_crack": "N/A", "feedback": ["Please enter a password to check its strength."]}
+        return StrengthDetails(score=0, strength="No Password", color=NO_PASSWORD_COLOR, percent=0, time_to_crack="N/A", feedback=("Please enter a password to check its strength.",))
+
+    # Classify and lowercase once and share the results with every check below
+    char_classes = get_character_classes(password)
+    password_lower = password.lower()
 
     # 1. Calculate theoretical entropy (V4)
-    initial_entropy = calculate_entropy_bits(password)
+    initial_entropy = calculate_entropy_bits(password, char_classes)
     
     # 2. Apply deductions to get effective entropy
-    effective_entropy = calculate_modified_score(password, initial_entropy)
+    effective_entropy, flags = calculate_modified_score(password, initial_entropy, char_classes, password_lower)
     
     # 3. Estimate crack time (V5)
     time_to_crack = estimate_crack_time(effective_entropy)
 
     # --- Level Classification based on Effective Entropy ---
     
-    color = "#D1D5DB"
-    percent = min(100, effective_entropy * 100 / 75) # Scale to 100 based on 75 bits being excellent
-    
-    if effective_entropy >= 65:
-        strength = "Excellent (Uncrackable)"
-        color = "#10B981"  # Emerald Green
-    elif effective_entropy >= 51:
-        strength = "Strong"
-        color = "#059669"  # Dark Green
-    elif effective_entropy >= 35:
-        strength = "Moderate"
-        color = "#F59E0B"  # Yellow/Amber
-    elif effective_entropy >= 15:
-        strength = "Weak"
-        color = "#EF4444"  # Red
-    else:
-        strength = "Too Weak"
-        color = "#B91C1C"  # Dark Red
+    # Scale to 100 based on 75 bits being excellent; the score is an int, so the percent stays one too
+    percent = 100 if effective_entropy >= 75 else effective_entropy * 100 // 75
+    strength, color = pick_bucket(STRENGTH_BUCKETS, effective_entropy)
     
     
     # --- Detailed Feedback Generation (Expanded) ---
@@ -239,10 +410,10 @@ def get_strength_details(password):
 
     # Check for inclusion of character types
     checks = {
-        'Lowercase letters (a-z)': re.search(r"[a-z]", password),
-        'Uppercase letters (A-Z)': re.search(r"[A-Z]", password),
-        'Digits (0-9)': re.search(r"\d", password),
-        'Symbols (!@#$)': re.search(r"[^a-zA-Z0-9\s]", password)
+        'Lowercase letters (a-z)': char_classes['lower'],
+        'Uppercase letters (A-Z)': char_classes['upper'],
+        'Digits (0-9)': char_classes['digit'],
+        'Symbols (!@#$)': char_classes['symbol']
     }
 
     # Length Feedback
@@ -259,54 +430,56 @@ def get_strength_details(password):
             feedback.append(f"✅ Complexity: Includes {key}.")
 
     # V8 Feedback (AI Heuristic)
-    is_ai_weak = False
-    for word1 in COMPLEX_WEAK_COMBINATIONS:
-        for word2 in COMPLEX_WEAK_COMBINATIONS:
-            if word1 != word2 and f"{word1}{word2}" in password.lower():
-                feedback.append("❌ AI Heuristic (V8): Detects concatenated common words (e.g., 'masterfirewall'). Highly predictable.")
-                is_ai_weak = True
-                break
-        if is_ai_weak: break
-        if re.search(f"{word1}\d+[a-z]+", password.lower()) or re.search(f"{word1}\d{{3,4}}$", password.lower()):
-             feedback.append("❌ AI Heuristic (V8): Detects common word combined with short numbers/years (e.g., 'shadow1990').")
-             is_ai_weak = True
-             break
+    if flags['ai_weak'] == 'concat':
+        feedback.append("❌ AI Heuristic (V8): Detects concatenated common words (e.g., 'masterfirewall'). Highly predictable.")
+    elif flags['ai_weak'] == 'digits':
+        feedback.append("❌ AI Heuristic (V8): Detects common word combined with short numbers/years (e.g., 'shadow1990').")
 
 
     # V1/V6 Pattern Deduction Feedback
-    is_weak_word = False
-    for word in COMMON_WEAK_WORDS:
-        if word in password.lower():
-            feedback.append(f"❌ Breach Risk (V6): Contains '{word}' which is a common dictionary word or breached password.")
-            is_weak_word = True
-            break
+    if flags['weak_word']:
+        feedback.append(f"❌ Breach Risk (V6): Contains '{flags['weak_word']}' which is a common dictionary word or breached password.")
             
-    if not is_weak_word and not is_ai_weak and effective_entropy < initial_entropy:
+    if not flags['weak_word'] and not flags['ai_weak'] and effective_entropy < initial_entropy:
         # Generic warning for other pattern deductions if no specific word was found
         feedback.append("⚠️ Warning: Contains easily guessable patterns (V2/V3/V7).")
 
 
     # V3/V7 Pattern Feedback
-    if re.search(r"(.{2})\1+", password) or re.search(r"(.{3})\1+", password):
+    if flags['repeat_block']:
         feedback.append("❌ Repetition (V3): Contains repeated blocks (e.g., 'abcabc').")
     
-    if re.search(r"(.)\1{2,}", password):
+    if flags['triple_repeat']:
         feedback.append("⚠️ Repetition: Contains triple or more repetitive characters (e.g., 'aaa').")
 
-    if re.search(r"(123|abc|xyz|qwerty)", password, re.IGNORECASE):
+    if flags['sequence']:
         feedback.append("⚠️ Warning: Contains simple sequential patterns ('123', 'abc').")
 
-    return {
-        "score": effective_entropy, 
-        "strength": strength, 
-        "color": color, 
-        "percent": percent, 
-        "time_to_crack": time_to_crack, 
-        "feedback": feedback
-    }
+    return StrengthDetails(
+        score=effective_entropy, 
+        strength=strength, 
+        color=color, 
+        percent=percent, 
+        time_to_crack=time_to_crack, 
+        feedback=tuple(feedback)
+    )
 
 # --- Tkinter GUI Application Class (Aesthetics Retained) ---
 
+# Delay after the last key release before re-running the analysis
+DEBOUNCE_DELAY_MS = 100
+
+# Cracking-time label color as (minimum effective entropy, color), strongest first
+TIME_COLOR_BUCKETS = (
+    (51, "#059669"),
+    (35, "#F59E0B"),
+    (0, "#CC0000"),  # Red/danger
+)
+
+def progressbar_style(color):
+    """Name of the progressbar style variant drawn in the given strength color."""
+    return f"{color}.Custom.Horizontal.TProgressbar"
+
 class PasswordCheckerApp:
     def __init__(self, master):
         self.master = master
@@ -329,6 +502,9 @@ class PasswordCheckerApp:
                         {'children': [('Horizontal.Progressbar.pbar', {'side': 'left', 'sticky': 'ns'})],
                          'sticky': 'nsew'})])
         style.configure('Custom.Horizontal.TProgressbar', troughcolor='#E5E7EB', borderwidth=0, thickness=12)
+        # One colored variant per strength level, so updates only switch the style name
+        for color in STRENGTH_COLORS:
+            style.configure(progressbar_style(color), background=color)
 
 
         # Main Frame (Container for content)
@@ -378,58 +554,74 @@ class PasswordCheckerApp:
                                      background='#F9F9F9', foreground='#333333', selectbackground='#C3D9FF')
         self.feedback_text.pack(fill='both', expand=True)
         
+        # Pending debounced analysis (Tk after() id), if any
+        self._pending = None
+
+        # Last values pushed to each widget, so unchanged ones aren't reconfigured (and redrawn)
+        self._shown = {}
+        self._last_feedback = None
+
         # Initial check to set the default state
-        self.check_strength_event(None)
+        self._do_check()
 
     def check_strength_event(self, event):
-        """Called on every key release in the password field."""
+        """Called on every key release in the password field; debounces the analysis."""
+        if self._pending is not None:
+            self.master.after_cancel(self._pending)
+        self._pending = self.master.after(DEBOUNCE_DELAY_MS, self._do_check)
+
+    def _do_check(self):
+        """Runs the analysis for the current password and refreshes the UI."""
+        self._pending = None
         password = self.password_entry.get()
+        if not password:
+            # Don't keep previously typed passwords around once the field is cleared
+            get_strength_details.cache_clear()
         details = get_strength_details(password) # Updated to use the new details structure
 
         # Update Strength Label
-        self.strength_label.config(text=details['strength'], foreground=details['color'])
+        self._update(self.strength_label, text=details.strength, foreground=details.color)
         
         # Update Time-to-Crack Label (V5)
-        self.time_label.config(text=f"Cracking Time: {details['time_to_crack']}")
         # Adjust Time Label Color based on strength
-        time_color = "#CC0000" if details['score'] < 35 else "#F59E0B" if details['score'] < 51 else "#059669"
-        self.time_label.config(foreground=time_color)
+        time_color = pick_bucket(TIME_COLOR_BUCKETS, details.score)[0]
+        self._update(self.time_label, text=f"Cracking Time: {details.time_to_crack}", foreground=time_color)
 
 
         # Update Score Label (V4: Entropy)
-        self.score_label.config(text=f"Effective Entropy: {details['score']} bits")
+        self._update(self.score_label, text=f"Effective Entropy: {details.score} bits")
 
         # Update Progress Bar Color and Value
-        style = ttk.Style()
-        style_name = f"{details['color']}.Custom.Horizontal.TProgressbar"
-        style.configure(style_name, background=details['color'])
-        self.strength_bar.config(style=style_name, value=details['percent'])
+        self._update(self.strength_bar, style=progressbar_style(details.color), value=details.percent)
         
-        # Update Feedback Text Area
+        # Update Feedback Text Area (only rewritten when the checklist changed)
+        feedback = details.feedback if password else ()
+        if feedback == self._last_feedback:
+            return
+        self._last_feedback = feedback
+
         self.feedback_text.config(state='normal')
         self.feedback_text.delete(1.0, tk.END)
         
         # Insert feedback lines
         if password:
-            for line in details['feedback']:
+            for line in feedback:
                 self.feedback_text.insert(tk.END, line + '\n')
         else:
             self.feedback_text.insert(tk.END, "Start typing your password to see the analysis.")
 
         self.feedback_text.config(state='disabled')
 
+    def _update(self, widget, **options):
+        """Configures only the widget options whose value changed since the last update."""
+        shown = self._shown.setdefault(str(widget), {})
+        changed = {key: value for key, value in options.items() if shown.get(key) != value}
+        if changed:
+            widget.config(**changed)
+            shown.update(changed)
+
 
 if __name__ == "__main__":
-    # Compile regex patterns for efficiency 
-    re.compile(r"[a-z]")
-    re.compile(r"[A-Z]")
-    re.compile(r"\d")
-    re.compile(r"[^a-zA-Z0-9\s]")
-    re.compile(r"(.)\1{2,}")
-    re.compile(r"(.{2})\1+")
-    re.compile(r"(.{3})\1+")
-    re.compile(r"(19|20)\d{2}")
-    
     # Initialize the desktop window
     root = tk.Tk()
     app = PasswordCheckerApp(root)